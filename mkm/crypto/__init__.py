@@ -57,6 +57,7 @@ __all__ = [
     'MD5', 'SHA1', 'SHA256', 'KECCAK256', 'RIPEMD160',
 
     'md5', 'sha1', 'sha256', 'keccak256', 'ripemd160',
+    'hash256', 'hash160',
 
     #
     #   Crypto
@@ -31,12 +31,16 @@ from .cryptography import CryptographyKey
 # noinspection PyAbstractClass
 class AsymmetricKey(CryptographyKey, ABC):
 
+    __slots__ = ()
+
     RSA = 'RSA'  # -- "RSA/ECB/PKCS1Padding", "SHA256withRSA"
     ECC = 'ECC'
 
 
 class SignKey(AsymmetricKey, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def sign(self, data: bytes) -> bytes:
         """
@@ -45,11 +49,13 @@ class SignKey(AsymmetricKey, ABC):
         :param data: message data
         :return: signature
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class VerifyKey(AsymmetricKey, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def verify(self, data: bytes, signature: bytes) -> bool:
         """
@@ -59,7 +65,7 @@ class VerifyKey(AsymmetricKey, ABC):
         :param signature: signature of message data
         :return: True on signature matched
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def match_sign_key(self, key: SignKey) -> bool:
@@ -69,4 +75,4 @@ class VerifyKey(AsymmetricKey, ABC):
         :param key: private key
         :return: True on signature matched
         """
-        raise NotImplemented
+        raise NotImplementedError
@@ -42,6 +42,8 @@ class CryptographyKey(Mapper, ABC):
         }
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def algorithm(self) -> str:
@@ -50,7 +52,7 @@ class CryptographyKey(Mapper, ABC):
 
         :return: algorithm name
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -60,11 +62,13 @@ class CryptographyKey(Mapper, ABC):
 
         :return: key data
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class EncryptKey(CryptographyKey, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def encrypt(self, data: bytes, extra: Optional[Dict]) -> bytes:
         """
@@ -77,11 +81,13 @@ class EncryptKey(CryptographyKey, ABC):
         :param extra: store extra variables ('IV' for 'AES')
         :return: ciphertext
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class DecryptKey(CryptographyKey, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def decrypt(self, data: bytes, params: Optional[Dict]) -> Optional[bytes]:
         """
@@ -94,7 +100,7 @@ class DecryptKey(CryptographyKey, ABC):
         :param params: extra params ('IV' for 'AES')
         :return: plaintext
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def match_encrypt_key(self, key: EncryptKey) -> bool:
@@ -104,4 +110,4 @@ class DecryptKey(CryptographyKey, ABC):
         :param key: encrypt (public) key
         :return: False on error
         """
-        raise NotImplemented
+        raise NotImplementedError
@@ -37,7 +37,7 @@ class DataDigester(ABC):
 
     @abstractmethod
     def digest(self, data: bytes) -> bytes:
-        raise NotImplemented
+        raise NotImplementedError
 
 
 #
@@ -46,23 +46,34 @@ class DataDigester(ABC):
 
 
 def md5(data: bytes) -> bytes:
-    return MD5.digest(data=data)
+    return MD5.digester.digest(data)
 
 
 def sha1(data: bytes) -> bytes:
-    return SHA1.digest(data=data)
+    return SHA1.digester.digest(data)
 
 
 def sha256(data: bytes) -> bytes:
-    return SHA256.digest(data=data)
+    return SHA256.digester.digest(data)
 
 
 def keccak256(data: bytes) -> bytes:
-    return KECCAK256.digest(data=data)
+    return KECCAK256.digester.digest(data)
 
 
 def ripemd160(data: bytes) -> bytes:
-    return RIPEMD160.digest(data=data)
+    return RIPEMD160.digester.digest(data)
+
+
+def hash256(data: bytes) -> bytes:
+    """ sha256(sha256(data)) """
+    digester = SHA256.digester
+    return digester.digest(digester.digest(data))
+
+
+def hash160(data: bytes) -> bytes:
+    """ ripemd160(sha256(data)) """
+    return RIPEMD160.digester.digest(SHA256.digester.digest(data))
 
 
 #
@@ -76,7 +87,7 @@ class MD5:
     @staticmethod
     def digest(data: bytes) -> bytes:
         # assert MD5.digester is not None, 'MD5 coder not set yet'
-        return MD5.digester.digest(data=data)
+        return MD5.digester.digest(data)
 
 
 class SHA1:
@@ -85,7 +96,7 @@ class SHA1:
     @staticmethod
     def digest(data: bytes) -> bytes:
         # assert SHA1.digester is not None, 'SHA1 coder not set yet'
-        return SHA1.digester.digest(data=data)
+        return SHA1.digester.digest(data)
 
 
 class SHA256:
@@ -94,7 +105,7 @@ class SHA256:
     @staticmethod
     def digest(data: bytes) -> bytes:
         # assert SHA256.digester is not None, 'SHA256 coder not set yet'
-        return SHA256.digester.digest(data=data)
+        return SHA256.digester.digest(data)
 
 
 class KECCAK256:
@@ -103,7 +114,7 @@ class KECCAK256:
     @staticmethod
     def digest(data: bytes) -> bytes:
         # assert KECCAK256.digester is not None, 'KECCAK256 coder not set yet'
-        return KECCAK256.digester.digest(data=data)
+        return KECCAK256.digester.digest(data)
 
 
 class RIPEMD160:
@@ -112,4 +123,4 @@ class RIPEMD160:
     @staticmethod
     def digest(data: bytes) -> bytes:
         # assert RIPEMD160.digester is not None, 'RIPEMD160 coder not set yet'
-        return RIPEMD160.digester.digest(data=data)
+        return RIPEMD160.digester.digest(data)
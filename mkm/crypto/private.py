@@ -44,6 +44,8 @@ class PrivateKey(SignKey, ABC):
         }
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def public_key(self) -> PublicKey:
@@ -52,7 +54,7 @@ class PrivateKey(SignKey, ABC):
 
         :return: public key paired to this private key
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #  Factory methods
@@ -93,7 +95,7 @@ class PrivateKeyFactory(ABC):
 
         :return: PrivateKey
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_private_key(self, key: Dict[str, Any]) -> Optional[PrivateKey]:
@@ -103,7 +105,7 @@ class PrivateKeyFactory(ABC):
         :param key: key info
         :return: PrivateKey
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class PrivateKeyHelper(ABC):
@@ -111,16 +113,16 @@ class PrivateKeyHelper(ABC):
 
     @abstractmethod
     def set_private_key_factory(self, algorithm: str, factory: PrivateKeyFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_private_key_factory(self, algorithm: str) -> Optional[PrivateKeyFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_private_key(self, algorithm: str) -> Optional[PrivateKey]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_private_key(self, key: Any) -> Optional[PrivateKey]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -44,25 +44,27 @@ class PublicKey(VerifyKey, ABC):
         }
     """
 
+    __slots__ = ()
+
     #
     #  Factory method
     #
 
     @classmethod
     def parse(cls, key: Any):  # -> Optional[PublicKey]:
-        helper = CryptoExtensions.symmetric_helper
+        helper = CryptoExtensions.public_helper
         assert isinstance(helper, PublicKeyHelper), 'public helper error: %s' % helper
         return helper.parse_public_key(key)
 
     @classmethod
     def get_factory(cls, algorithm: str):  # -> Optional[PublicKeyFactory]:
-        helper = CryptoExtensions.symmetric_helper
+        helper = CryptoExtensions.public_helper
         assert isinstance(helper, PublicKeyHelper), 'public helper error: %s' % helper
         return helper.get_public_key_factory(algorithm=algorithm)
 
     @classmethod
     def set_factory(cls, algorithm: str, factory):
-        helper = CryptoExtensions.symmetric_helper
+        helper = CryptoExtensions.public_helper
         assert isinstance(helper, PublicKeyHelper), 'public helper error: %s' % helper
         helper.set_public_key_factory(algorithm=algorithm, factory=factory)
 
@@ -77,19 +79,19 @@ class PublicKeyFactory(ABC):
         :param key: key info
         :return: PublicKey
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class PublicKeyHelper(ABC):
 
     @abstractmethod
     def set_public_key_factory(self, algorithm: str, factory: PublicKeyFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_public_key_factory(self, algorithm: str) -> Optional[PublicKeyFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_public_key(self, key: Any) -> Optional[PublicKey]:
-        raise NotImplemented
+        raise NotImplementedError
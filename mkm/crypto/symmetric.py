@@ -44,6 +44,8 @@ class SymmetricKey(EncryptKey, DecryptKey, ABC):
         }
     """
 
+    __slots__ = ()
+
     AES = 'AES'  # -- "AES/CBC/PKCS7Padding"
     DES = 'DES'
 
@@ -86,7 +88,7 @@ class SymmetricKeyFactory(ABC):
 
         :return: SymmetricKey
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_symmetric_key(self, key: Dict[str, Any]) -> Optional[SymmetricKey]:
@@ -96,7 +98,7 @@ class SymmetricKeyFactory(ABC):
         :param key: key info
         :return: SymmetricKey
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class SymmetricKeyHelper(ABC):
@@ -104,16 +106,16 @@ class SymmetricKeyHelper(ABC):
 
     @abstractmethod
     def set_symmetric_key_factory(self, algorithm: str, factory: SymmetricKeyFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_symmetric_key_factory(self, algorithm: str) -> Optional[SymmetricKeyFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_symmetric_key(self, algorithm: str) -> Optional[SymmetricKey]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_symmetric_key(self, key: Any) -> Optional[SymmetricKey]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -45,7 +45,7 @@ class DataCoder(ABC):
         :param data: binary data
         :return:     text string (Base58/64, Hex, ...)
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def decode(self, string: str) -> Optional[bytes]:
@@ -55,7 +55,7 @@ class DataCoder(ABC):
         :param string: text string (Base58/64, Hex, ...)
         :return:       binary data
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class Hex:
@@ -64,12 +64,12 @@ class Hex:
     @staticmethod
     def encode(data: bytes) -> str:
         # assert Hex.coder is not None, 'Hex coder not set yet'
-        return Hex.coder.encode(data=data)
+        return Hex.coder.encode(data)
 
     @staticmethod
     def decode(string: str) -> Optional[bytes]:
         # assert Hex.coder is not None, 'Hex coder not set yet'
-        return Hex.coder.decode(string=string)
+        return Hex.coder.decode(string)
 
 
 class Base58:
@@ -78,12 +78,12 @@ class Base58:
     @staticmethod
     def encode(data: bytes) -> str:
         # assert Base58.coder is not None, 'Base58 coder not set yet'
-        return Base58.coder.encode(data=data)
+        return Base58.coder.encode(data)
 
     @staticmethod
     def decode(string: str) -> Optional[bytes]:
         # assert Base58.coder is not None, 'Base58 coder not set yet'
-        return Base58.coder.decode(string=string)
+        return Base58.coder.decode(string)
 
 
 class Base64:
@@ -92,12 +92,12 @@ class Base64:
     @staticmethod
     def encode(data: bytes) -> str:
         # assert Base64.coder is not None, 'Base64 coder not set yet'
-        return Base64.coder.encode(data=data)
+        return Base64.coder.encode(data)
 
     @staticmethod
     def decode(string: str) -> Optional[bytes]:
         # assert Base64.coder is not None, 'Base64 coder not set yet'
-        return Base64.coder.decode(string=string)
+        return Base64.coder.decode(string)
 
 
 #
@@ -106,24 +106,24 @@ class Base64:
 
 
 def base64_encode(data: bytes) -> str:
-    return Base64.encode(data)
+    return Base64.coder.encode(data)
 
 
 def base64_decode(string: str) -> Optional[bytes]:
-    return Base64.decode(string)
+    return Base64.coder.decode(string)
 
 
 def base58_encode(data: bytes) -> str:
-    return Base58.encode(data)
+    return Base58.coder.encode(data)
 
 
 def base58_decode(string: str) -> Optional[bytes]:
-    return Base58.decode(string)
+    return Base58.coder.decode(string)
 
 
 def hex_encode(data: bytes) -> str:
-    return Hex.encode(data)
+    return Hex.coder.encode(data)
 
 
 def hex_decode(string: str) -> Optional[bytes]:
-    return Hex.decode(string)
+    return Hex.coder.decode(string)
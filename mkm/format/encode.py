@@ -63,7 +63,7 @@ class TransportableData(Mapper, ABC):
 
         :return: 'base64'
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -73,7 +73,7 @@ class TransportableData(Mapper, ABC):
 
         :return: plaintext
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def __str__(self) -> str:
@@ -85,7 +85,7 @@ class TransportableData(Mapper, ABC):
                  'data:image/png;base64,{BASE64_ENCODE}', or
                  '{...}'
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -155,7 +155,7 @@ class TransportableDataFactory(ABC):
         :param data: original data
         :return: TED object
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_transportable_data(self, ted: Dict[str, Any]) -> Optional[TransportableData]:
@@ -165,7 +165,7 @@ class TransportableDataFactory(ABC):
         :param ted: TED info
         :return: TED object
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class TransportableDataHelper(ABC):
@@ -173,16 +173,16 @@ class TransportableDataHelper(ABC):
 
     @abstractmethod
     def set_transportable_data_factory(self, algorithm: str, factory: TransportableDataFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_transportable_data_factory(self, algorithm: str) -> Optional[TransportableDataFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_transportable_data(self, algorithm: str, data: bytes) -> TransportableData:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_transportable_data(self, ted: Any) -> Optional[TransportableData]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -65,22 +65,22 @@ class PortableNetworkFile(Mapper, ABC):
     @property
     @abstractmethod
     def data(self) -> Optional[bytes]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @data.setter
     @abstractmethod
     def data(self, content: Optional[bytes]):
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def filename(self) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @filename.setter
     @abstractmethod
     def filename(self, string: Optional[str]):
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Download URL
@@ -89,12 +89,12 @@ class PortableNetworkFile(Mapper, ABC):
     @abstractmethod
     def url(self) -> Optional[URI]:
         # download URL from CDN
-        raise NotImplemented
+        raise NotImplementedError
 
     @url.setter
     @abstractmethod
     def url(self, string: Optional[URI]):
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Password for decrypting the downloaded data from CDN,
@@ -103,12 +103,12 @@ class PortableNetworkFile(Mapper, ABC):
     @property
     @abstractmethod
     def password(self) -> Optional[DecryptKey]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @password.setter
     @abstractmethod
     def password(self, key: Optional[DecryptKey]):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def __str__(self) -> str:
@@ -120,7 +120,7 @@ class PortableNetworkFile(Mapper, ABC):
                  'data:image/png;base64,{BASE64_ENCODE}', or
                  '{...}'
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -186,7 +186,7 @@ class PortableNetworkFileFactory(ABC):
         :param password: decrypt key for downloaded data
         :return: PNF object
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_portable_network_file(self, pnf: Dict[str, Any]) -> Optional[PortableNetworkFile]:
@@ -196,7 +196,7 @@ class PortableNetworkFileFactory(ABC):
         :param pnf: PNF info
         :return: PNF object
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class PortableNetworkFileHelper(ABC):
@@ -204,17 +204,17 @@ class PortableNetworkFileHelper(ABC):
 
     @abstractmethod
     def set_portable_network_file_factory(self, factory: PortableNetworkFileFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_portable_network_file_factory(self) -> Optional[PortableNetworkFileFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_portable_network_file(self, data: Optional[TransportableData], filename: Optional[str],
                                      url: Optional[URI], password: Optional[DecryptKey]) -> PortableNetworkFile:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_portable_network_file(self, pnf: Any) -> Optional[PortableNetworkFile]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -45,7 +45,7 @@ class ObjectCoder(ABC):
         :param obj: Map or List
         :return: serialized string
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def decode(self, string: str) -> Optional[Any]:
@@ -55,7 +55,7 @@ class ObjectCoder(ABC):
         :param string: serialized string
         :return: Map or List
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class JSON:
@@ -64,12 +64,12 @@ class JSON:
     @staticmethod
     def encode(obj: Any) -> str:
         # assert JSON.coder is not None, 'JSON parser not set yet'
-        return JSON.coder.encode(obj=obj)
+        return JSON.coder.encode(obj)
 
     @staticmethod
     def decode(string: str) -> Optional[Any]:
         # assert JSON.coder is not None, 'JSON parser not set yet'
-        return JSON.coder.decode(string=string)
+        return JSON.coder.decode(string)
 
 
 class MapCoder(ObjectCoder, ABC):
@@ -77,11 +77,11 @@ class MapCoder(ObjectCoder, ABC):
 
     # Override
     def encode(self, obj: Dict) -> str:
-        return JSON.encode(obj=obj)
+        return JSON.coder.encode(obj)
 
     # Override
     def decode(self, string: str) -> Optional[Dict]:
-        return JSON.decode(string=string)
+        return JSON.coder.decode(string)
 
 
 class ListCoder(ObjectCoder, ABC):
@@ -89,11 +89,11 @@ class ListCoder(ObjectCoder, ABC):
 
     # Override
     def encode(self, obj: List) -> str:
-        return JSON.encode(obj=obj)
+        return JSON.coder.encode(obj)
 
     # Override
     def decode(self, string: str) -> Optional[List]:
-        return JSON.decode(string=string)
+        return JSON.coder.decode(string)
 
 
 class JSONMap:
@@ -102,12 +102,12 @@ class JSONMap:
     @staticmethod
     def encode(obj: Any) -> str:
         # assert JSONMap.coder is not None, 'JSONMap parser not set yet'
-        return JSONMap.coder.encode(obj=obj)
+        return JSONMap.coder.encode(obj)
 
     @staticmethod
     def decode(string: str) -> Optional[Any]:
         # assert JSONMap.coder is not None, 'JSONMap parser not set yet'
-        return JSONMap.coder.decode(string=string)
+        return JSONMap.coder.decode(string)
 
 
 class JSONList:
@@ -116,12 +116,12 @@ class JSONList:
     @staticmethod
     def encode(obj: Any) -> str:
         # assert JSONList.coder is not None, 'JSONList parser not set yet'
-        return JSONList.coder.encode(obj=obj)
+        return JSONList.coder.encode(obj)
 
     @staticmethod
     def decode(string: str) -> Optional[Any]:
         # assert JSONList.coder is not None, 'JSONList parser not set yet'
-        return JSONList.coder.decode(string=string)
+        return JSONList.coder.decode(string)
 
 
 #
@@ -130,8 +130,8 @@ class JSONList:
 
 
 def json_encode(obj: Union[Dict, List]) -> str:
-    return JSON.encode(obj=obj)
+    return JSON.coder.encode(obj)
 
 
 def json_decode(string: str) -> Union[Dict, List, None]:
-    return JSON.decode(string=string)
+    return JSON.coder.decode(string)
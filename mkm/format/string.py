@@ -45,7 +45,7 @@ class StringCoder(ABC):
         :param string: local string
         :return: binary data
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def decode(self, data: bytes) -> Optional[str]:
@@ -55,7 +55,7 @@ class StringCoder(ABC):
         :param data: binary data
         :return: local string
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class UTF8:
@@ -64,12 +64,12 @@ class UTF8:
     @staticmethod
     def encode(string: str) -> bytes:
         # assert UTF8.coder is not None, 'UTF8 parser not set yet'
-        return UTF8.coder.encode(string=string)
+        return UTF8.coder.encode(string)
 
     @staticmethod
     def decode(data: bytes) -> Optional[str]:
         # assert UTF8.coder is not None, 'UTF8 parser not set yet'
-        return UTF8.coder.decode(data=data)
+        return UTF8.coder.decode(data)
 
 
 #
@@ -78,8 +78,8 @@ class UTF8:
 
 
 def utf8_encode(string: str) -> bytes:
-    return UTF8.encode(string=string)
+    return UTF8.coder.encode(string)
 
 
 def utf8_decode(data: bytes) -> Optional[str]:
-    return UTF8.decode(data=data)
+    return UTF8.coder.decode(data)
@@ -41,11 +41,11 @@ class GeneralAccountHelper(ABC):
 
     @abstractmethod
     def get_meta_type(self, meta: Dict, default: Optional[str]) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_document_type(self, document: Dict, default: Optional[str]) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
 
 @Singleton
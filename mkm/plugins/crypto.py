@@ -24,12 +24,14 @@
 # ==============================================================================
 
 from abc import ABC, abstractmethod
+from hmac import compare_digest
 from typing import Optional, Dict
 
 from ..types import Singleton
 
 from ..crypto import SignKey, VerifyKey
 from ..crypto import EncryptKey, DecryptKey
+from ..crypto import PrivateKey
 
 from ..crypto.symmetric import SymmetricKeyHelper
 from ..crypto.private import PrivateKeyHelper
@@ -42,21 +44,33 @@ class GeneralCryptoHelper(ABC):
     """ CryptographyKey GeneralFactory """
 
     """ sample data for checking keys """
-    PROMISE = 'Moky loves May Lee forever!'.encode('utf-8')
+    PROMISE = b'Moky loves May Lee forever!'
 
     @classmethod
     def match_asymmetric_keys(cls, sign_key: SignKey, verify_key: VerifyKey) -> bool:
         """ verify with signature """
-        signature = sign_key.sign(data=cls.PROMISE)
-        return verify_key.verify(data=cls.PROMISE, signature=signature)
+        if isinstance(sign_key, PrivateKey):
+            public_key = sign_key.public_key
+            if public_key is verify_key or (public_key is not None and public_key.data == verify_key.data):
+                # paired with the private key itself, no need to sign
+                return True
+        promise = cls.PROMISE
+        signature = sign_key.sign(data=promise)
+        return verify_key.verify(data=promise, signature=signature)
 
     @classmethod
     def match_symmetric_keys(cls, encrypt_key: EncryptKey, decrypt_key: DecryptKey) -> bool:
         """ check by encryption """
+        if isinstance(decrypt_key, PrivateKey):
+            public_key = decrypt_key.public_key
+            if public_key is encrypt_key or (public_key is not None and public_key.data == encrypt_key.data):
+                # paired with the private key itself, no need to encrypt
+                return True
+        promise = cls.PROMISE
         extra = {}
-        ciphertext = encrypt_key.encrypt(data=cls.PROMISE, extra=extra)
+        ciphertext = encrypt_key.encrypt(data=promise, extra=extra)
         plaintext = decrypt_key.decrypt(data=ciphertext, params=extra)
-        return plaintext == cls.PROMISE
+        return plaintext is not None and compare_digest(plaintext, promise)
 
     #
     #   Algorithm
@@ -64,7 +78,7 @@ class GeneralCryptoHelper(ABC):
 
     @abstractmethod
     def get_key_algorithm(self, key: Dict, default: Optional[str]) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
 
 @Singleton
@@ -43,7 +43,7 @@ class GeneralFormatHelper(ABC):
 
     @abstractmethod
     def get_format_algorithm(self, ted: Dict, default: Optional[str]) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
 
 @Singleton
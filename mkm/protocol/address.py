@@ -54,7 +54,7 @@ class Address(Stringer, ABC):
 
         :return: 0 ~ 255
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Factory methods
@@ -97,7 +97,7 @@ class AddressFactory(ABC):
         :param network: address type
         :return: Address
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_address(self, address: str) -> Optional[Address]:
@@ -107,7 +107,7 @@ class AddressFactory(ABC):
         :param address: address string
         :return: Address
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class AddressHelper(ABC):
@@ -115,16 +115,16 @@ class AddressHelper(ABC):
 
     @abstractmethod
     def set_address_factory(self, factory: AddressFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_address_factory(self) -> Optional[AddressFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_address(self, meta, network: int = None) -> Address:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_address(self, address: Any) -> Optional[Address]:
-        raise NotImplemented
+        raise NotImplementedError
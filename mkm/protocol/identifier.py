@@ -53,41 +53,41 @@ class ID(Stringer, ABC):
     @property
     @abstractmethod
     def name(self) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def address(self) -> Address:
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def terminal(self) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def type(self) -> int:
         # return self.address.type
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def is_broadcast(self) -> bool:
         # return EntityType.is_broadcast(type)
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def is_user(self) -> bool:
         # return EntityType.is_user(type)
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def is_group(self) -> bool:
         # return EntityType.is_group(type)
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Conveniences
@@ -165,7 +165,7 @@ class IDFactory(ABC):
         :param terminal: ID.terminal
         :return: ID
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_identifier(self, name: Optional[str], address: Address, terminal: Optional[str]) -> ID:
@@ -177,7 +177,7 @@ class IDFactory(ABC):
         :param terminal: ID.terminal
         :return: ID
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_identifier(self, identifier: str) -> Optional[ID]:
@@ -187,7 +187,7 @@ class IDFactory(ABC):
         :param identifier: ID string
         :return: ID
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class IdentifierHelper(ABC):
@@ -195,28 +195,28 @@ class IdentifierHelper(ABC):
 
     @abstractmethod
     def set_identifier_factory(self, factory: IDFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_identifier_factory(self) -> Optional[IDFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_identifier(self, meta, network: Optional[int], terminal: Optional[str]) -> ID:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_identifier(self, name: Optional[str], address: Address, terminal: Optional[str]) -> ID:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_identifier(self, identifier: Any) -> Optional[ID]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def convert_identifiers(self, array: Iterable) -> List[ID]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def revert_identifiers(self, array: Iterable[ID]) -> List[str]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -76,7 +76,7 @@ class Meta(Mapper, ABC):
             4 = ETH : eth_address
             ...
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -89,7 +89,7 @@ class Meta(Mapper, ABC):
 
         :return: public key
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -99,7 +99,7 @@ class Meta(Mapper, ABC):
 
         :return: ID.name
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -112,7 +112,7 @@ class Meta(Mapper, ABC):
 
         :return: signature
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Validation
@@ -127,7 +127,7 @@ class Meta(Mapper, ABC):
 
         :return: True on valid
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_address(self, network: int = None) -> Address:
@@ -137,7 +137,7 @@ class Meta(Mapper, ABC):
         :param network:  Address.type
         :return: Address
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Factory methods
@@ -187,7 +187,7 @@ class MetaFactory(ABC):
         :param seed:        ID.name
         :return: Meta
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_meta(self, public_key: VerifyKey, seed: Optional[str], fingerprint: Optional[TransportableData]) -> Meta:
@@ -199,7 +199,7 @@ class MetaFactory(ABC):
         :param fingerprint: private_key.sign(seed)
         :return: Meta
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_meta(self, meta: Dict[str, Any]) -> Optional[Meta]:
@@ -209,7 +209,7 @@ class MetaFactory(ABC):
         :param meta: meta info
         :return: Meta
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class MetaHelper(ABC):
@@ -217,21 +217,21 @@ class MetaHelper(ABC):
 
     @abstractmethod
     def set_meta_factory(self, version: str, factory: MetaFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_meta_factory(self, version: str) -> Optional[MetaFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def generate_meta(self, version: str, private_key: SignKey, seed: Optional[str]) -> Meta:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_meta(self, version: str, public_key: VerifyKey,
                     seed: Optional[str], fingerprint: Optional[TransportableData]) -> Meta:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_meta(self, meta: Any) -> Optional[Meta]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -53,7 +53,7 @@ class TAI(ABC):
 
         :return: True on matched
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #  signature
@@ -67,7 +67,7 @@ class TAI(ABC):
         :param public_key: public key in meta.key
         :return: True on signature matched
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def sign(self, private_key: SignKey) -> Optional[bytes]:
@@ -77,7 +77,7 @@ class TAI(ABC):
         :param private_key: private key match meta.key
         :return: signature, None on error
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #  properties
@@ -91,7 +91,7 @@ class TAI(ABC):
 
         :return: inner dictionary
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_property(self, name: str) -> Optional[Any]:
@@ -101,7 +101,7 @@ class TAI(ABC):
         :param name: property key
         :return: property value
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def set_property(self, name: str, value: Optional[Any]):
@@ -112,4 +112,4 @@ class TAI(ABC):
         :param name:  property key
         :param value: property value
         """
-        raise NotImplemented
+        raise NotImplementedError
@@ -69,7 +69,7 @@ class Document(TAI, Mapper, ABC):
 
         :return: doc type
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -79,7 +79,7 @@ class Document(TAI, Mapper, ABC):
 
         :return: Entity ID
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
@@ -89,7 +89,7 @@ class Document(TAI, Mapper, ABC):
 
         :return: timestamp
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #  properties getter/setter
@@ -102,7 +102,7 @@ class Document(TAI, Mapper, ABC):
 
         :return: name string
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @name.setter
     @abstractmethod
@@ -113,7 +113,7 @@ class Document(TAI, Mapper, ABC):
         :param string: name string
         :return:
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     #
     #   Factory Methods
@@ -160,7 +160,7 @@ class DocumentFactory(ABC):
         :param signature:  document signature
         :return: Document
         """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_document(self, document: Dict[str, Any]) -> Optional[Document]:
@@ -170,7 +170,7 @@ class DocumentFactory(ABC):
         :param document:
         :return:
         """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class DocumentHelper(ABC):
@@ -178,17 +178,17 @@ class DocumentHelper(ABC):
 
     @abstractmethod
     def set_document_factory(self, doc_type: str, factory: DocumentFactory):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_document_factory(self, doc_type: str) -> Optional[DocumentFactory]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def create_document(self, doc_type: str, identifier: ID,
                         data: Optional[str], signature: Optional[TransportableData]) -> Document:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def parse_document(self, document: Any) -> Optional[Document]:
-        raise NotImplemented
+        raise NotImplementedError
@@ -33,7 +33,10 @@ class Converter(ABC):
 
     @classmethod
     def get_str(cls, value: Any, default: Optional[str]) -> Optional[str]:
-        if value is None:
+        if type(value) is str:
+            # plain string, the common case
+            return value
+        elif value is None:
             return default
         elif isinstance(value, str):
             # exactly
@@ -28,6 +28,7 @@ from abc import ABC
 from typing import Any, Dict, List
 
 from .wrapper import Mapper
+from .wrapper import PRIMITIVE_TYPES
 
 
 class Copier(ABC):
@@ -38,9 +39,9 @@ class Copier(ABC):
             return None
         elif isinstance(o, Mapper):
             return cls.copy_map(o.dictionary)
-        elif isinstance(o, Dict):
+        elif isinstance(o, dict):
             return cls.copy_map(o)
-        elif isinstance(o, List):
+        elif isinstance(o, list):
             return cls.copy_list(o)
         else:
             return o
@@ -59,13 +60,14 @@ class Copier(ABC):
 
     @classmethod
     def deep_copy(cls, o: Any) -> Any:
-        if o is None:
-            return None
+        if type(o) in PRIMITIVE_TYPES:
+            # immutable, no need to copy
+            return o
         elif isinstance(o, Mapper):
             return cls.deep_copy_map(o.dictionary)
-        elif isinstance(o, Dict):
+        elif isinstance(o, dict):
             return cls.deep_copy_map(o)
-        elif isinstance(o, List):
+        elif isinstance(o, list):
             return cls.deep_copy_list(o)
         else:
             # return o
@@ -74,14 +76,19 @@ class Copier(ABC):
     @classmethod
     def deep_copy_map(cls, d: Dict) -> Dict:
         dictionary = {}
-        for k in d:
-            v = d[k]
-            dictionary[k] = cls.deep_copy(v)
+        for k, v in d.items():
+            if type(v) in PRIMITIVE_TYPES:
+                dictionary[k] = v
+            else:
+                dictionary[k] = cls.deep_copy(v)
         return dictionary
 
     @classmethod
     def deep_copy_list(cls, a: List) -> List:
         array = []
         for item in a:
-            array.append(cls.deep_copy(item))
+            if type(item) in PRIMITIVE_TYPES:
+                array.append(item)
+            else:
+                array.append(cls.deep_copy(item))
         return array
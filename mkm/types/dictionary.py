@@ -23,6 +23,7 @@
 # SOFTWARE.
 # ==============================================================================
 
+from types import MappingProxyType
 from typing import Any, Optional, Iterator, Tuple, Dict
 from typing import Mapping, ItemsView, KeysView, ValuesView
 
@@ -39,6 +40,7 @@ class Dictionary(Mapper):
         ~~~~~~~~~~~~~~~~~~~
         A container sharing the same inner dictionary
     """
+    __slots__ = ('_Dictionary__dictionary', '__weakref__')
 
     def __init__(self, dictionary: Dict = None):
         super().__init__()
@@ -59,6 +61,10 @@ class Dictionary(Mapper):
         else:
             return self.__dictionary.copy()
 
+    def view(self) -> Mapping[str, Any]:
+        """ read-only view of the inner dictionary, without copying """
+        return MappingProxyType(self.__dictionary)
+
     # Override
     def clear(self):
         """ D.clear() -> None.  Remove all items from D. """
@@ -160,7 +166,7 @@ class Dictionary(Mapper):
 
         Return the value for key if key is in the dictionary, else default.
         """
-        self.__dictionary.setdefault(key, default)
+        return self.__dictionary.setdefault(key, default)
 
     # Override
     def update(self, __m: Mapping[str, Any], **kwargs: Any):
@@ -173,11 +179,11 @@ class Dictionary(Mapper):
 
     def __contains__(self, o) -> bool:
         """ True if the dictionary has the specified key, else False. """
-        return self.__dictionary.__contains__(o)
+        return o in self.__dictionary
 
     def __delitem__(self, v: str):
         """ Delete self[key]. """
-        self.__dictionary.__delitem__(v)
+        del self.__dictionary[v]
 
     def __eq__(self, o: Dict) -> bool:
         """ Return self==value. """
@@ -187,7 +193,7 @@ class Dictionary(Mapper):
                 return True
             o = o.dictionary
         # check inner map
-        return self.__dictionary.__eq__(o)
+        return self.__dictionary == o
 
     # def __getattribute__(self, name: str) -> Any:
     #     """ Return getattr(self, name). """
@@ -197,7 +203,7 @@ class Dictionary(Mapper):
 
     def __getitem__(self, k: str) -> Any:
         """ x.__getitem__(y) <==> x[y] """
-        return self.__dictionary.__getitem__(k)
+        return self.__dictionary[k]
 
     def __ge__(self, other) -> bool:
         """ Return self>=value. """
@@ -209,11 +215,11 @@ class Dictionary(Mapper):
 
     def __iter__(self) -> Iterator[str]:
         """ Implement iter(self). """
-        return self.__dictionary.__iter__()
+        return iter(self.__dictionary)
 
     def __len__(self) -> int:
         """ Return len(self). """
-        return self.__dictionary.__len__()
+        return len(self.__dictionary)
 
     def __le__(self, other) -> bool:
         """ Return self<=value. """
@@ -231,15 +237,15 @@ class Dictionary(Mapper):
                 return False
             o = o.dictionary
         # check inner map
-        return self.__dictionary.__ne__(o)
+        return self.__dictionary != o
 
     def __repr__(self) -> str:
         """ Return repr(self). """
-        return self.__dictionary.__repr__()
+        return repr(self.__dictionary)
 
     def __setitem__(self, k: str, v: Optional[Any]):
         """ Set self[key] to value. """
-        self.__dictionary.__setitem__(k, v)
+        self.__dictionary[k] = v
 
     def __sizeof__(self) -> int:
         """ D.__sizeof__() -> size of D in memory, in bytes """
@@ -29,11 +29,16 @@ from typing import Optional, Any, MutableMapping, Dict, List
 from .x import DateTime
 
 
+# immutable leaf values, returned as they are by unwrap/deep_copy
+PRIMITIVE_TYPES = frozenset([str, int, float, bool, bytes, type(None)])
+
+
 class Stringer(ABC):
     """
         Constant String Wrapper
         ~~~~~~~~~~~~~~~~~~~~~~~
     """
+    __slots__ = ()
 
     def __hash__(self) -> int:
         return NotImplemented
@@ -62,49 +67,50 @@ class Mapper(MutableMapping[str, Any], ABC):
         Mutable Map Wrapper
         ~~~~~~~~~~~~~~~~~~~
     """
+    __slots__ = ()
 
     @abstractmethod
     def get_str(self, key: str, default: Optional[str]) -> Optional[str]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_bool(self, key: str, default: Optional[bool]) -> Optional[bool]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_int(self, key: str, default: Optional[int]) -> Optional[int]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_float(self, key: str, default: Optional[float]) -> Optional[float]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def get_datetime(self, key: str, default: Optional[DateTime]) -> Optional[DateTime]:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def set_datetime(self, key: str, value: Optional[DateTime]):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def set_string(self, key: str, value: Optional[Stringer]):
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def set_map(self, key: str, value):  # value: Optional[Mapper]
-        raise NotImplemented
+        raise NotImplementedError
 
     @property
     @abstractmethod
     def dictionary(self) -> Dict[str, Any]:
         """ get inner map """
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def copy_dictionary(self, deep_copy: bool = False) -> Dict[str, Any]:
         """ copy inner map """
-        raise NotImplemented
+        raise NotImplementedError
 
 
 class Wrapper:
@@ -115,7 +121,10 @@ class Wrapper:
             Get inner string
             ~~~~~~~~~~~~~~~~
         """
-        if s is None:
+        if type(s) is str:
+            # plain string, the common case
+            return s
+        elif s is None:
             return None
         elif isinstance(s, Stringer):
             return s.string
@@ -132,11 +141,14 @@ class Wrapper:
             ~~~~~~~~~~~~~
             Remove first wrapper
         """
-        if d is None:
+        if type(d) is dict:
+            # plain dict, the common case
+            return d
+        elif d is None:
             return None
         elif isinstance(d, Mapper):
             return d.dictionary
-        elif isinstance(d, Dict):
+        elif isinstance(d, dict):
             return d
         else:
             assert False, 'map error: %s' % d
@@ -147,13 +159,19 @@ class Wrapper:
             Unwrap object container
             ~~~~~~~~~~~~~~~~~~~~~~~
         """
-        if o is None:
-            return None
+        clazz = type(o)
+        if clazz in PRIMITIVE_TYPES:
+            return o
+        elif clazz is dict:
+            return cls.unwrap_dict(o)
+        elif clazz is list:
+            return cls.unwrap_list(o)
+        # check wrappers & subclasses
         elif isinstance(o, Mapper):
             return cls.unwrap_dict(o.dictionary)
-        elif isinstance(o, Dict):
+        elif isinstance(o, dict):
             return cls.unwrap_dict(o)
-        elif isinstance(o, List):
+        elif isinstance(o, list):
             return cls.unwrap_list(o)
         elif isinstance(o, Stringer):
             return o.string
@@ -166,10 +184,12 @@ class Wrapper:
         if isinstance(d, Mapper):
             d = d.dictionary
         dictionary = {}
-        for key in d:
-            value = d[key]
-            naked = cls.unwrap(value)
-            dictionary[key] = naked
+        for key, value in d.items():
+            if type(value) in PRIMITIVE_TYPES:
+                # immutable leaf, nothing to unwrap
+                dictionary[key] = value
+            else:
+                dictionary[key] = cls.unwrap(value)
         return dictionary
 
     @classmethod
@@ -177,6 +197,9 @@ class Wrapper:
         """ Unwrap values in the array """
         array = []
         for item in a:
-            naked = cls.unwrap(item)
-            array.append(naked)
+            if type(item) in PRIMITIVE_TYPES:
+                # immutable leaf, nothing to unwrap
+                array.append(item)
+            else:
+                array.append(cls.unwrap(item))
         return array